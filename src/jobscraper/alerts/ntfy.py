@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 
@@ -11,6 +13,9 @@ import requests
 DEFAULT_SERVER = "https://ntfy.sh"
 DEFAULT_TOPIC_FILE = Path("data/ntfy_topic.txt")
 
+# Shared session so chunked sends (send_many) reuse one TLS connection.
+_SESSION = requests.Session()
+
 
 @dataclass(frozen=True)
 class NtfyConfig:
@@ -19,27 +24,35 @@ class NtfyConfig:
     token: str = ""  # optional (for private/self-hosted auth)
 
 
-def load_topic(
-    *,
-    topic: Optional[str] = None,
-    topic_file: Path = DEFAULT_TOPIC_FILE,
-    env_key: str = "NTFY_TOPIC",
-) -> str:
+@lru_cache(maxsize=4)
+def _load_topic_cached(topic: str, topic_file: str, env_val: str) -> str:
     if topic:
         return topic.strip()
 
-    env = (os.getenv(env_key) or "").strip()
-    if env:
-        return env
+    if env_val:
+        return env_val
 
-    if topic_file.exists():
-        t = topic_file.read_text(encoding="utf-8").strip()
+    tf = Path(topic_file)
+    if tf.exists():
+        t = tf.read_text(encoding="utf-8").strip()
         if t:
             return t
 
     return ""
 
 
+def load_topic(
+    *,
+    topic: Optional[str] = None,
+    topic_file: Path = DEFAULT_TOPIC_FILE,
+    env_key: str = "NTFY_TOPIC",
+) -> str:
+    # The env value is part of the cache key, so overriding NTFY_TOPIC still
+    # takes effect; only the topic-file stat+read is skipped on repeat calls
+    # (send_many hits this once per chunk).
+    return _load_topic_cached(topic or "", str(topic_file), (os.getenv(env_key) or "").strip())
+
+
 def send(
     *,
     message: str,
@@ -70,7 +83,7 @@ def send(
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    resp = requests.post(url, data=message.encode("utf-8"), headers=headers, timeout=timeout_s)
+    resp = _SESSION.post(url, data=message.encode("utf-8"), headers=headers, timeout=timeout_s)
     resp.raise_for_status()
 
 
@@ -92,15 +105,31 @@ def send_many(
     We chunk defensively.
     """
 
+    parts: list[str] = []
     buf: list[str] = []
     size = 0
 
-    def flush(i: int) -> None:
-        if not buf:
-            return
+    for ln in lines:
+        ln = ln.rstrip()
+        if not ln:
+            continue
+        if size + len(ln) + 1 > max_chars and buf:
+            parts.append("\n".join(buf))
+            buf = []
+            size = 0
+        buf.append(ln)
+        size += len(ln) + 1
+
+    if buf:
+        parts.append("\n".join(buf))
+    if not parts:
+        return
+
+    def send_part(numbered: tuple[int, str]) -> None:
+        i, message = numbered
         send(
             title=f"{title} ({i})" if i > 1 else title,
-            message="\n".join(buf),
+            message=message,
             topic=topic,
             server=server,
             tags=tags,
@@ -109,17 +138,12 @@ def send_many(
             token=token,
         )
 
-    part = 1
-    for ln in lines:
-        ln = ln.rstrip()
-        if not ln:
-            continue
-        if size + len(ln) + 1 > max_chars and buf:
-            flush(part)
-            part += 1
-            buf = []
-            size = 0
-        buf.append(ln)
-        size += len(ln) + 1
+    if len(parts) == 1:
+        send_part((1, parts[0]))
+        return
 
-    flush(part)
+    # Post the chunks concurrently; they share the module session's
+    # connection pool, so a long alert delivers in ~1 round trip. The (i)
+    # suffix keeps ordering readable in the ntfy UI.
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(send_part, enumerate(parts, start=1)))
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 
@@ -10,6 +11,9 @@ import requests
 
 API_URL = "https://api.pushover.net/1/messages.json"
 
+# Shared session so repeated sends reuse one TLS connection.
+_SESSION = requests.Session()
+
 
 @dataclass(frozen=True)
 class PushoverConfig:
@@ -17,7 +21,9 @@ class PushoverConfig:
     app_token: str
 
 
-def load_from_envfile(path: Path = Path("data/pushover.env")) -> Optional[PushoverConfig]:
+@lru_cache(maxsize=4)
+def _load_cached(path_str: str, mtime_ns: int, env_user: str, env_token: str) -> Optional[PushoverConfig]:
+    path = Path(path_str)
     if path.exists():
         for line in path.read_text(encoding="utf-8").splitlines():
             line = line.strip()
@@ -33,6 +39,18 @@ def load_from_envfile(path: Path = Path("data/pushover.env")) -> Optional[Pushov
     return PushoverConfig(user_key=user, app_token=token)
 
 
+def load_from_envfile(path: Path = Path("data/pushover.env")) -> Optional[PushoverConfig]:
+    # Keyed on the env-file mtime and the live env vars, so edits to either
+    # still invalidate; repeat calls skip the stat+read+parse.
+    mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+    return _load_cached(
+        str(path),
+        mtime_ns,
+        (os.getenv("PUSHOVER_USER_KEY") or "").strip(),
+        (os.getenv("PUSHOVER_APP_TOKEN") or "").strip(),
+    )
+
+
 def send(
     *,
     title: str,
@@ -59,7 +77,7 @@ def send(
     if url_title:
         data["url_title"] = url_title
 
-    resp = requests.post(API_URL, data=data, timeout=timeout_s)
+    resp = _SESSION.post(API_URL, data=data, timeout=timeout_s)
     resp.raise_for_status()
 
 
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from pathlib import Path
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 from jobscraper.filtering import is_relevant
 from jobscraper.sources.aneti import AnetiConfig, scrape_aneti
 from jobscraper.alerts.ntfy import send_many
@@ -12,12 +18,21 @@ from jobscraper.alerts.ntfy import send_many
 def load_state(path: Path) -> dict:
     if not path.exists():
         return {}
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text(encoding="utf-8"))
 
 
 def save_state(path: Path, state: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Write-then-rename so a SIGKILL mid-write can't leave a truncated
+    # state file; keeps the human-readable indented output either way.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        tmp.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def main() -> int:
@@ -4,6 +4,24 @@ import re
 from dataclasses import dataclass
 from typing import Iterable, List
 
+try:
+    # google-re2: linear-time engine, immune to alternation backtracking.
+    import re2 as _re2
+except Exception:  # pragma: no cover - optional dependency
+    _re2 = None
+
+try:
+    # hyperscan: multi-pattern DFA, used for bulk title scans only.
+    import hyperscan as _hyperscan
+except Exception:  # pragma: no cover - optional dependency
+    _hyperscan = None
+
+try:
+    # pyahocorasick: matches all rule keywords in one pass over the title.
+    import ahocorasick as _ahocorasick
+except Exception:  # pragma: no cover - optional dependency
+    _ahocorasick = None
+
 
 # Scraper behavior:
 # - Titles that match DELETE_PATTERNS are discarded even if they match TECH/AI/SALES.
@@ -84,8 +102,47 @@ DELETE_PATTERNS: list[str] = [
     r"\bvendeuse\b",
 ]
 
-_RE_TOO_SENIOR = re.compile("|".join(f"(?:{p})" for p in TOO_SENIOR_PATTERNS), flags=re.IGNORECASE)
-_RE_DELETE = re.compile("|".join(f"(?:{p})" for p in DELETE_PATTERNS), flags=re.IGNORECASE)
+def _compile_union(patterns: List[str]):
+    """Compile one case-insensitive union regex, preferring re2 when installed.
+
+    The ~50-way DELETE_PATTERNS alternation is linear-time under re2's DFA;
+    stdlib re (backtracking) remains the fallback and behaves identically.
+    """
+    joined = "|".join(f"(?:{p})" for p in patterns)
+    if _re2 is not None:
+        # google-re2 has no module-level flag constants; case folding goes
+        # through Options. No except here on purpose: if the API drifts we
+        # want a loud failure, not a silent fallback to backtracking re.
+        opts = _re2.Options()
+        opts.case_sensitive = False
+        return _re2.compile(joined, options=opts)
+    return re.compile(joined, flags=re.IGNORECASE)
+
+
+_RE_TOO_SENIOR = _compile_union(TOO_SENIOR_PATTERNS)
+_RE_DELETE = _compile_union(DELETE_PATTERNS)
+
+
+def _compile_hyperscan(patterns: List[str]):
+    if _hyperscan is None:
+        return None
+    try:
+        db = _hyperscan.Database()
+        # No HS_FLAG_UCP: hyperscan rejects \b in UCP mode, and the block
+        # patterns lean on word boundaries. Plain UTF-8 boundaries are what
+        # stdlib re gives these patterns anyway.
+        flags = _hyperscan.HS_FLAG_CASELESS | _hyperscan.HS_FLAG_SINGLEMATCH | _hyperscan.HS_FLAG_UTF8
+        db.compile(
+            expressions=[p.encode("utf-8") for p in patterns],
+            ids=list(range(len(patterns))),
+            flags=[flags] * len(patterns),
+        )
+        return db
+    except Exception:  # pragma: no cover - pattern not supported by hyperscan
+        return None
+
+
+_HS_DELETE_DB = _compile_hyperscan(DELETE_PATTERNS)
 
 
 @dataclass(frozen=True)
@@ -265,13 +322,58 @@ BROAD_RULES: List[KeywordRule] = [
 ]
 
 
+# Titles are matched lowercased; normalize the rule keywords once at import
+# so the per-title scan does no .lower() allocation per keyword.
+BROAD_RULES = [KeywordRule(label=r.label, keywords=[k.lower() for k in r.keywords]) for r in BROAD_RULES]
+
+
+def _build_automaton(rules: List[KeywordRule]):
+    """Build one Aho-Corasick automaton over all rule keywords (lowercased).
+
+    Each word maps to the tuple of labels it can trigger, so a keyword shared
+    by two rules still lights up both.
+    """
+    if _ahocorasick is None:
+        return None
+    words: dict[str, list[str]] = {}
+    for rule in rules:
+        for k in rule.keywords:
+            labels = words.setdefault(k.lower(), [])
+            if rule.label not in labels:
+                labels.append(rule.label)
+    ac = _ahocorasick.Automaton()
+    for word, labels in words.items():
+        ac.add_word(word, tuple(labels))
+    ac.make_automaton()
+    return ac
+
+
+_BROAD_AUTOMATON = _build_automaton(BROAD_RULES)
+
+# "Any positive hit at all?" as one union regex (every rule keyword plus the
+# whole-word IA check), for callers that only need a yes/no, not the labels.
+_POSITIVE_RE = _compile_union([re.escape(k) for rule in BROAD_RULES for k in rule.keywords] + [r"\bia\b"])
+
+
 def match_labels(text: str, rules: Iterable[KeywordRule] = BROAD_RULES) -> List[str]:
     t = (text or "").lower()
     labels: List[str] = []
 
-    for rule in rules:
-        if any(k.lower() in t for k in rule.keywords):
-            labels.append(rule.label)
+    # One linear pass over the text instead of a substring scan per keyword.
+    # Labels are re-emitted in rule order to keep output stable.
+    ac = _BROAD_AUTOMATON if rules is BROAD_RULES else None
+    if ac is not None:
+        matched: set[str] = set()
+        for _, word_labels in ac.iter(t):
+            matched.update(word_labels)
+        labels = [rule.label for rule in rules if rule.label in matched]
+    else:
+        if rules is not BROAD_RULES:
+            # Caller-supplied rules get normalized once per call, not per keyword.
+            rules = [KeywordRule(label=r.label, keywords=[k.lower() for k in r.keywords]) for r in rules]
+        for rule in rules:
+            if any(k in t for k in rule.keywords):
+                labels.append(rule.label)
 
     # Important: avoid false positives on "IA" from substrings like "Industria...".
     # Match IA as a whole word only.
@@ -279,14 +381,7 @@ def match_labels(text: str, rules: Iterable[KeywordRule] = BROAD_RULES) -> List[
         labels.append("AI")
 
     # de-dupe while keeping order
-    out: List[str] = []
-    seen = set()
-    for l in labels:
-        if l in seen:
-            continue
-        seen.add(l)
-        out.append(l)
-    return out
+    return list(dict.fromkeys(labels))
 
 
 def is_too_senior(text: str) -> bool:
@@ -303,6 +398,30 @@ def is_blocked(text: str) -> bool:
     return bool(_RE_DELETE.search(t))
 
 
+def is_blocked_many(titles: Iterable[str]) -> List[bool]:
+    """Bulk is_blocked for export/labeling passes over many titles.
+
+    With hyperscan installed, all DELETE_PATTERNS are matched in a single
+    scan per title; otherwise this is just is_blocked in a loop.
+    """
+    titles = list(titles)
+    if _HS_DELETE_DB is None:
+        return [is_blocked(t) for t in titles]
+
+    out = [False] * len(titles)
+    for i, title in enumerate(titles):
+        t = (title or "").strip()
+        if not t:
+            continue
+        # A truthy handler return halts the scan at the first hit, which
+        # python-hyperscan surfaces as ScanTerminated — a match, not an error.
+        try:
+            _HS_DELETE_DB.scan(t.encode("utf-8"), match_event_handler=lambda *_a: 1)
+        except _hyperscan.ScanTerminated:
+            out[i] = True
+    return out
+
+
 def decision_for_title(title: str) -> str:
     # Only apply OVERSENIOR if the job is relevant in the first place.
     # This avoids tagging random irrelevant jobs as OVERSENIOR.
@@ -369,4 +488,7 @@ def is_english_title(title: str) -> bool:
 def is_relevant(text: str, rules: Iterable[KeywordRule] = BROAD_RULES) -> bool:
     if is_blocked(text):
         return False
+    if rules is BROAD_RULES:
+        # Single regex pass; equivalent to "match_labels found something".
+        return bool(_POSITIVE_RE.search(text or ""))
     return len(match_labels(text, rules=rules)) > 0
@@ -4,11 +4,25 @@ import csv
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+from urllib.parse import quote
+
+import requests
+
+try:
+    # google-auth: lets us talk to the Sheets API directly with one token,
+    # skipping a gog process spawn (Node startup + OAuth refresh) per batch.
+    import google.auth
+    from google.auth.transport.requests import Request as _GoogleAuthRequest
+except Exception:  # pragma: no cover - optional dependency
+    google = None
 
 from .gog import run_gog
 
 
+_SHEETS_API = "https://sheets.googleapis.com/v4/spreadsheets"
+
+
 @dataclass
 class AllJobsSheetConfig:
     sheet_id: str
@@ -20,15 +34,75 @@ def _run_gog(args: List[str]) -> None:
     run_gog(args, check=True)
 
 
+def _col_letter(n: int) -> str:
+    """1-based column number -> A1 column letters (1 -> A, 27 -> AA)."""
+    s = ""
+    while n:
+        n, r = divmod(n - 1, 26)
+        s = chr(ord("A") + r) + s
+    return s
+
+
+def _api_session() -> Optional[requests.Session]:
+    """Mint one access token and return a pooled session for direct API calls.
+
+    Returns None when google-auth (or default credentials) is unavailable;
+    callers then fall back to the gog CLI.
+    """
+    if google is None:
+        return None
+    try:
+        creds, _ = google.auth.default(scopes=["https://www.googleapis.com/auth/spreadsheets"])
+        creds.refresh(_GoogleAuthRequest())
+    except Exception:
+        return None
+    sess = requests.Session()
+    sess.headers["Authorization"] = f"Bearer {creds.token}"
+    return sess
+
+
+def _write_rows_api(sess: requests.Session, cfg: AllJobsSheetConfig, rows: List[List[str]]) -> int:
+    """Clear the tab and upload the grid over one keep-alive connection.
+
+    Batches of 5000 rows keep each request well under the API's payload cap;
+    no per-batch process spawn, TLS handshake, or token refresh.
+    """
+    base = f"{_SHEETS_API}/{cfg.sheet_id}"
+
+    resp = sess.post(f"{base}/values/{quote(f'{cfg.tab}!A1:Z', safe='')}:clear")
+    resp.raise_for_status()
+
+    for start in range(0, len(rows), 5000):
+        chunk = rows[start : start + 5000]
+        resp = sess.post(
+            f"{base}/values:batchUpdate",
+            json={
+                "valueInputOption": "USER_ENTERED",
+                "data": [{"range": f"{cfg.tab}!A{start + 1}", "values": chunk}],
+            },
+        )
+        resp.raise_for_status()
+
+    return len(rows) - 1
+
+
 def clear_tab(cfg: AllJobsSheetConfig) -> None:
     # Clear a generous range.
     _run_gog(["gog", "sheets", "clear", cfg.sheet_id, f"{cfg.tab}!A1:Z", "--account", cfg.account])
 
 
-def write_all_jobs_csv_to_sheet(cfg: AllJobsSheetConfig, csv_path: Path, batch_rows: int = 120) -> int:
+def write_all_jobs_csv_to_sheet(cfg: AllJobsSheetConfig, csv_path: Path, max_payload_chars: int = 25000) -> int:
     """Overwrite the All jobs tab from a local CSV.
 
-    Uses update for header then append in batches.
+    The whole grid (header included) is written with `sheets update` calls at
+    explicit row offsets, packing as many rows per call as fit under the argv
+    payload cap. Small exports go up in a single invocation; large ones use
+    far fewer invocations than the old fixed-size append batches.
+
+    Note: `gog sheets update --values-json <...>` passes JSON via argv, which
+    can hit OS command-length limits ("Argument list too long"); that is what
+    max_payload_chars guards.
+
     Returns number of data rows uploaded.
     """
 
@@ -38,55 +112,47 @@ def write_all_jobs_csv_to_sheet(cfg: AllJobsSheetConfig, csv_path: Path, batch_r
     if not rows:
         return 0
 
-    header, data = rows[0], rows[1:]
+    sess = _api_session()
+    if sess is not None:
+        try:
+            return _write_rows_api(sess, cfg, rows)
+        finally:
+            sess.close()
 
     clear_tab(cfg)
 
-    _run_gog(
-        [
-            "gog",
-            "sheets",
-            "update",
-            cfg.sheet_id,
-            f"{cfg.tab}!A1:{chr(ord('A') + len(header) - 1)}1",
-            "--account",
-            cfg.account,
-            "--values-json",
-            json.dumps([header], ensure_ascii=False),
-            "--input",
-            "USER_ENTERED",
-        ]
-    )
-
-    # Append in batches.
-    # Note: `gog sheets append --values-json <...>` passes JSON via argv, which can hit OS
-    # command-length limits ("Argument list too long") depending on row count.
-    # We keep batches small and also fall back to smaller chunks when needed.
-    i = 0
-    while i < len(data):
-        chunk = data[i : i + batch_rows]
-
-        # Adaptive shrink if argv payload gets too large.
-        payload = json.dumps(chunk, ensure_ascii=False)
-        while len(payload) > 25000 and len(chunk) > 1:
-            chunk = chunk[: max(1, len(chunk) // 2)]
-            payload = json.dumps(chunk, ensure_ascii=False)
+    last_col = _col_letter(max(len(r) for r in rows))
+
+    start = 0
+    row_index = 1  # sheet row of the next chunk (row 1 = header)
+    while start < len(rows):
+        # Greedily pack rows while the JSON payload stays under the cap.
+        chunk: List[List[str]] = []
+        size = 2  # enclosing brackets
+        while start + len(chunk) < len(rows):
+            r = rows[start + len(chunk)]
+            r_size = len(json.dumps(r, ensure_ascii=False)) + 2  # + ", " separator
+            if chunk and size + r_size > max_payload_chars:
+                break
+            chunk.append(r)
+            size += r_size
 
         _run_gog(
             [
                 "gog",
                 "sheets",
-                "append",
+                "update",
                 cfg.sheet_id,
-                f"{cfg.tab}!A:Z",
+                f"{cfg.tab}!A{row_index}:{last_col}{row_index + len(chunk) - 1}",
                 "--account",
                 cfg.account,
                 "--values-json",
-                payload,
-                "--insert",
-                "INSERT_ROWS",
+                json.dumps(chunk, ensure_ascii=False),
+                "--input",
+                "USER_ENTERED",
             ]
         )
-        i += len(chunk)
+        start += len(chunk)
+        row_index += len(chunk)
 
-    return len(data)
+    return len(rows) - 1
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import datetime as dt
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, List, Optional
-from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from selectolax.parser import HTMLParser
 
 from ..models import Job
@@ -49,6 +51,7 @@ class KeejobConfig:
     user_agent: str = "Mozilla/5.0 (compatible; job-scraper/0.1; +https://wassimfekih.com)"
 
 
+@lru_cache(maxsize=64)
 def _date_fr(d: dt.date) -> str:
     return f"{d.day} {_MONTHS_FR[d.month]} {d.year}"
 
@@ -75,29 +78,36 @@ def _parse_list_page(html: str) -> List[dict]:
         job_id = m.group(1)
 
         title = title_a.text(strip=True)
-        url = urljoin(BASE, href.split("?")[0])
-
+        # _JOB_ID_RE anchored the href at /offres-emploi/<id>/, so the absolute
+        # URL is plain concatenation; urljoin is pure Python and costly here.
+        if "?" in href:
+            href = href[: href.index("?")]
+        url = BASE + href
+
+        # One targeted query instead of walking every <a> in the article.
+        # A card can carry several company anchors (logo link first, text
+        # link after); keep the first one with actual text.
         company = ""
-        for a in art.css("a"):
-            h = a.attributes.get("href", "")
-            if h.startswith("/offres-emploi/companies/"):
-                t = a.text(strip=True)
-                if t:
-                    company = t
-                    break
+        for a in art.css('a[href^="/offres-emploi/companies/"]'):
+            t = a.text(strip=True)
+            if t:
+                company = t
+                break
 
         lines = [l.strip() for l in art.text(separator="\n", strip=True).split("\n") if l.strip()]
 
+        # The card shows exactly one date (location on the line above it), so
+        # stop at the first date-looking line instead of regexing every line.
         date_line = ""
-        for l in lines:
+        date_idx = -1
+        for i, l in enumerate(lines):
             if _DATE_RE.search(l):
                 date_line = l
+                date_idx = i
+                break
 
-        location = ""
-        if date_line and date_line in lines:
-            idx = lines.index(date_line)
-            if idx > 0:
-                location = lines[idx - 1].strip()
+        # The line right before the date is the location.
+        location = lines[date_idx - 1] if date_idx > 0 else ""
 
         jobs.append(
             {
@@ -113,48 +123,106 @@ def _parse_list_page(html: str) -> List[dict]:
     return jobs
 
 
+# How many listing pages to fetch concurrently. Matches the session's
+# pool_maxsize; keep small to stay polite to keejob.com.
+_FETCH_BATCH = 4
+
+
+def _make_session(cfg: KeejobConfig) -> requests.Session:
+    # One session per scrape so all pages reuse the same keep-alive connection
+    # instead of paying a TCP+TLS handshake per page.
+    sess = requests.Session()
+    sess.headers.update({"User-Agent": cfg.user_agent})
+    sess.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        ),
+    )
+    return sess
+
+
+def _fetch_pages(sess: requests.Session, cfg: KeejobConfig, pages: Iterable[int]) -> List[str]:
+    """Fetch several listing pages concurrently, returning HTML in page order.
+
+    Page N's URL doesn't depend on page N-1's content (the template is keyed
+    on the page number), so the fetches can overlap; only the today_only
+    cutoff needs the pages back in order.
+    """
+
+    def one(page: int) -> str:
+        resp = sess.get(cfg.list_url_template.format(page=page), timeout=cfg.timeout_s)
+        resp.raise_for_status()
+        return resp.text
+
+    with ThreadPoolExecutor(max_workers=_FETCH_BATCH) as ex:
+        return list(ex.map(one, pages))
+
+
+def _parse_pages(htmls: List[str]) -> List[List[dict]]:
+    """Parse a batch of listing pages, using multiple cores when it pays off.
+
+    _parse_list_page is pure CPU (selectolax) and shares no state, so the
+    GIL is the only thing serializing it; a process pool sidesteps that for
+    multi-page batches. A single page is parsed inline.
+    """
+    if len(htmls) <= 1:
+        return [_parse_list_page(h) for h in htmls]
+    with ProcessPoolExecutor(max_workers=min(4, len(htmls))) as ex:
+        return list(ex.map(_parse_list_page, htmls))
+
+
 def scrape_keejob(cfg: Optional[KeejobConfig] = None) -> tuple[List[Job], str]:
     cfg = cfg or KeejobConfig()
 
-    headers = {"User-Agent": cfg.user_agent}
     # Keejob's "date" label is human text (French) and sometimes lags around midnight.
     # Accept today OR yesterday when today_only is enabled.
     tz = dt.timezone(dt.timedelta(hours=1))
     now = dt.datetime.now(dt.timezone.utc).astimezone(tz).date()
     today_fr = _date_fr(now)
     yesterday_fr = _date_fr(now - dt.timedelta(days=1))
+    recent_dates = frozenset((today_fr, yesterday_fr))
 
     out: List[Job] = []
 
-    for page in range(1, cfg.max_pages + 1):
-        url = cfg.list_url_template.format(page=page)
-        resp = requests.get(url, headers=headers, timeout=cfg.timeout_s)
-        resp.raise_for_status()
+    with _make_session(cfg) as sess:
+        # Fetch speculative batches of pages concurrently, then walk them in
+        # order so the today_only "no recent -> stop" cutoff is unchanged.
+        done = False
+        for start in range(1, cfg.max_pages + 1, _FETCH_BATCH):
+            pages = range(start, min(start + _FETCH_BATCH, cfg.max_pages + 1))
+            for page_jobs in _parse_pages(_fetch_pages(sess, cfg, pages)):
+                if not page_jobs:
+                    done = True
+                    break
 
-        page_jobs = _parse_list_page(resp.text)
-        if not page_jobs:
-            break
+                recent_found = False
+                for j in page_jobs:
+                    if cfg.today_only:
+                        if j.get("date") not in recent_dates:
+                            continue
+                        recent_found = True
+
+                    out.append(
+                        Job(
+                            source="keejob",
+                            external_id=j["id"],
+                            title=j.get("title") or "(unknown)",
+                            company=j.get("company") or "",
+                            location=j.get("location") or "",
+                            url=j.get("url") or "",
+                            posted_at=None,
+                        )
+                    )
+
+                # Stop condition: if today_only and this page had no jobs stamped today/yesterday.
+                if cfg.today_only and not recent_found:
+                    done = True
+                    break
 
-        # Stop condition: if today_only and this page has no jobs stamped today/yesterday.
-        if cfg.today_only:
-            any_recent = any(j.get("date") in (today_fr, yesterday_fr) for j in page_jobs)
-            if not any_recent:
+            if done:
                 break
 
-        for j in page_jobs:
-            if cfg.today_only and j.get("date") not in (today_fr, yesterday_fr):
-                continue
-
-            out.append(
-                Job(
-                    source="keejob",
-                    external_id=j["id"],
-                    title=j.get("title") or "(unknown)",
-                    company=j.get("company") or "",
-                    location=j.get("location") or "",
-                    url=j.get("url") or "",
-                    posted_at=None,
-                )
-            )
-
     return out, today_fr
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import datetime as dt
+import json
 import re
+import weakref
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+from playwright.async_api import async_playwright
 from playwright.sync_api import TimeoutError as PWTimeoutError
 from playwright.sync_api import sync_playwright
 
@@ -15,7 +19,14 @@ from jobscraper.models import Job
 from jobscraper.sheets_sync import SheetsConfig, append_jobs, ensure_jobs_header
 
 
+_BASE = "https://www.tanitjobs.com"
+_UTC = dt.timezone.utc
+
 _JOB_RE = re.compile(r"/job/(\d+)(?:/|$)")
+_FULL_DATE_RE = re.compile(r"\d{2}/\d{2}/\d{4}")
+# Listing chrome like "2849 annonces trouvées" that must not become a title.
+_NOISE_RE = re.compile(r"annonces trouv", re.IGNORECASE)
+_LINE_RE = re.compile(r"[^\r\n]+")
 
 
 @dataclass
@@ -28,120 +39,296 @@ class CatchupConfig:
 
 
 def _now_utc() -> dt.datetime:
-    return dt.datetime.now(dt.timezone.utc)
+    return dt.datetime.now(_UTC)
 
 
-def _extract_jobs_from_page(page) -> List[Job]:
-    """Extract job cards from the current listing page.
+def _slug_from_url(url: str, jid: str) -> str:
+    """Derive a readable title from /job/<id>/<slug>/ when the anchor text is unusable."""
+    # partition never raises and skips split's list allocations; a URL
+    # without the /job/<id>/ marker just yields an empty tail.
+    _, _, after = url.partition(f"/job/{jid}/")
+    if not after:
+        return ""
+    return after.partition("?")[0].strip("/").replace("-", " ")
 
-    We try to collect:
-    - id from /job/<id>/
-    - title from link text
-    - posted date from nearby text (dd/mm/yyyy)
 
-    Note: some top items can be promoted and may not show a date.
+def _first_meaningful_line(card_text: str) -> str:
+    """First card line that isn't blank, the date stamp, or listing chrome.
+
+    Walks the text with finditer instead of materializing a stripped copy of
+    every line; a dense card exits at the first usable line.
     """
+    for m in _LINE_RE.finditer(card_text):
+        line = m.group(0).strip()
+        if not line or _FULL_DATE_RE.fullmatch(line) or _NOISE_RE.search(line):
+            continue
+        return line
+    return ""
 
-    items = page.eval_on_selector_all(
-        "a[href*='/job/']",
-        """
-        els => {
+
+_CARD_SELECTOR = "a[href*='/job/']"
+
+# One in-browser pass per anchor: closest() finds the card container (no
+# fixed ancestor walk), textContent avoids the layout flush that innerText
+# forces, and date/slug come back already extracted so Python only handles
+# small strings. Shared by the sync and async extraction paths.
+_EXTRACT_JS = r"""
+        (els, arg) => {
           const out = [];
+          let dropped = 0;
           const dateRe = /\b\d{2}\/\d{2}\/\d{4}\b/;
           for (const a of els) {
             const href = a.getAttribute('href') || '';
             if (!href.includes('/job/')) continue;
-            const text = (a.textContent || '').trim();
 
-            // Walk up a few ancestors to find a container that contains a date.
-            let node = a;
+            const card = a.closest("article, li, .job, [class*='job']");
             let cardText = '';
-            for (let i = 0; i < 6 && node; i++) {
-              const t = (node.innerText || node.textContent || '').trim();
-              if (t && (dateRe.test(t) || t.length > cardText.length)) {
-                cardText = t;
+            let dm = null;
+            if (card) {
+              cardText = (card.textContent || '').trim();
+              dm = dateRe.exec(cardText);
+            } else {
+              // No recognizable container: walk up a few ancestors but stop
+              // at the first node whose text carries the date stamp instead
+              // of always expanding to the widest one.
+              let node = a.parentElement;
+              for (let i = 0; i < 6 && node; i++) {
+                const t = (node.textContent || '').trim();
+                const m = dateRe.exec(t);
+                if (m) { cardText = t; dm = m; break; }
+                if (t.length > cardText.length) cardText = t;
+                node = node.parentElement;
               }
-              node = node.parentElement;
             }
 
-            out.push({ href, text, cardText });
+            let ts = 0;
+            if (dm) {
+              const [dd, mm, yy] = dm[0].split('/');
+              ts = Date.UTC(+yy, +mm - 1, +dd);
+            }
+            if (ts && arg.cutoffMs && ts < arg.cutoffMs) {
+              dropped++;
+              // Listings are newest-first: a few too-old dated cards in a
+              // row mean the rest of the page is older still, so stop
+              // scanning anchors altogether.
+              if (arg.earlyStop && dropped >= arg.earlyStop) break;
+              continue;
+            }
+
+            let slugTitle = '';
+            const afterJob = href.split('/job/')[1] || '';
+            const segs = afterJob.split('/');
+            if (segs.length > 1 && segs[1]) {
+              slugTitle = segs[1].replace(/[?#].*$/, '').replace(/-/g, ' ').trim();
+            }
+
+            out.push({
+              href,
+              text: (a.textContent || '').trim(),
+              dateStr: dm ? dm[0] : '',
+              slugTitle,
+              cardText,
+            });
           }
-          return out;
+          return { items: out, dropped };
         }
-        """,
+        """
+
+
+# Too-old dated cards to tolerate before the JS stops scanning the page's
+# remaining anchors; a couple of slack slots absorb a stray promoted card.
+_EARLY_STOP = 3
+
+
+def _cutoff_arg(cutoff: Optional[dt.datetime]) -> dict:
+    if not cutoff:
+        return {"cutoffMs": 0, "earlyStop": 0}
+    return {"cutoffMs": int(cutoff.timestamp() * 1000), "earlyStop": _EARLY_STOP}
+
+
+# Raw CDP sessions, one per sync page, created lazily. eval_on_selector_all
+# routes through Playwright's dispatcher (selector resolution in an isolated
+# world plus result re-wrapping); a bare Runtime.evaluate with returnByValue
+# is a single round trip carrying one JSON string. Weak keys so a closed
+# page doesn't pin its session.
+_CDP_SESSIONS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _extract_via_cdp(page, arg: dict) -> dict:
+    cdp = _CDP_SESSIONS.get(page)
+    if cdp is None:
+        cdp = page.context.new_cdp_session(page)
+        _CDP_SESSIONS[page] = cdp
+    expr = "JSON.stringify((%s)(Array.from(document.querySelectorAll(%s)), %s))" % (
+        _EXTRACT_JS,
+        json.dumps(_CARD_SELECTOR),
+        json.dumps(arg),
     )
+    res = cdp.send("Runtime.evaluate", {"expression": expr, "returnByValue": True})
+    # A JS exception leaves no "value" key; the KeyError lands in the caller's
+    # fallback path.
+    return json.loads(res["result"]["value"])
+
+
+def _extract_jobs_from_page(
+    page,
+    cutoff: Optional[dt.datetime] = None,
+    known_ids: Optional[set] = None,
+    relevance: Optional[Callable[[str], bool]] = None,
+) -> Tuple[List[Job], List[Job], int, int]:
+    """Extract job cards from the current listing page.
 
-    jobs: List[Job] = []
-    seen: set[str] = set()
+    We try to collect:
+    - id from /job/<id>/
+    - title from link text
+    - posted date from nearby text (dd/mm/yyyy)
+
+    Note: some top items can be promoted and may not show a date; those are
+    always returned.
+
+    When a cutoff is given, dated cards older than it are dropped inside the
+    browser (less CDP payload, no Python work for them); the count of dropped
+    cards comes back so the caller can use it as its stop-paging signal.
+    known_ids and relevance fuse the caller's filtering into the same pass:
+    see _jobs_from_eval.
+
+    Extraction goes over a raw CDP session when possible and falls back to
+    eval_on_selector_all if that session is unusable (detached tab, browsers
+    without the CDP domain).
+
+    Returns: (new_jobs, relevant_new_jobs, dropped_older_than_cutoff, cards_seen)
+    """
+
+    arg = _cutoff_arg(cutoff)
+    try:
+        result = _extract_via_cdp(page, arg)
+    except Exception:
+        _CDP_SESSIONS.pop(page, None)
+        result = page.eval_on_selector_all(_CARD_SELECTOR, _EXTRACT_JS, arg)
+    return _jobs_from_eval(result, known_ids, relevance)
+
+
+def _jobs_from_eval(
+    result: dict,
+    known_ids: Optional[set] = None,
+    relevance: Optional[Callable[[str], bool]] = None,
+) -> Tuple[List[Job], List[Job], int, int]:
+    """Turn the _EXTRACT_JS payload into Jobs; see _extract_jobs_from_page.
+
+    Dedup against known_ids happens before any string surgery, so already-
+    ingested cards never materialize a Job, and the relevance predicate is
+    applied to the title in the same pass instead of re-walking the batch
+    afterwards.
+    """
+
+    items = result.get("items") or []
+    dropped = int(result.get("dropped") or 0)
+
+    # Listing markup points several anchors per card at the same /job/<id>/
+    # (title, logo, apply button); keep the first item per id so the
+    # Job-building loop below runs once per unique posting.
+    unique: dict[str, dict] = {}
     for item in items:
+        m = _JOB_RE.search(item.get("href") or "")
+        if m and m.group(1) not in unique:
+            unique[m.group(1)] = item
+
+    jobs: List[Job] = []
+    relevant: List[Job] = []
+    for jid, item in unique.items():
+        if known_ids is not None and jid in known_ids:
+            continue
+
         href = (item.get("href") or "").strip()
         text = (item.get("text") or "").strip()
         card_text = (item.get("cardText") or "").strip()
 
-        m = _JOB_RE.search(href)
-        if not m:
-            continue
-        jid = m.group(1)
-        if jid in seen:
-            continue
-        seen.add(jid)
-
         if href.startswith("/"):
-            url = "https://www.tanitjobs.com" + href
+            url = _BASE + href
         elif href.startswith("http"):
             url = href
         else:
-            url = "https://www.tanitjobs.com/" + href.lstrip("/")
-
-        title = text or "(unknown)"
+            url = _BASE + "/" + href.lstrip("/")
 
+        # The browser already located the dd/mm/yyyy string for this card.
         posted_at = None
-        dm = re.search(r"\b(\d{2})/(\d{2})/(\d{4})\b", card_text)
-        if dm:
-            dd, mm, yyyy = dm.group(1), dm.group(2), dm.group(3)
+        date_str = (item.get("dateStr") or "").strip()
+        if date_str:
             try:
-                posted_at = dt.datetime(int(yyyy), int(mm), int(dd), tzinfo=dt.timezone.utc)
+                dd, mm, yyyy = date_str.split("/")
+                posted_at = dt.datetime(int(yyyy), int(mm), int(dd), tzinfo=_UTC)
             except Exception:
                 posted_at = None
 
-        # Avoid garbage titles like "2849 annonces trouvées".
-        if "annonces trouv" in title.lower():
-            title = "(unknown)"
-
-        if title == "(unknown)":
-            # Prefer deriving a title from the URL slug.
-            # /job/<id>/<slug>/
-            try:
-                slug = url.split(f"/job/{jid}/", 1)[1].split("?", 1)[0].strip("/")
-                if slug:
-                    slug = slug.replace("-", " ")
-                    title = slug
-            except Exception:
-                pass
-
-        if title == "(unknown)" and card_text:
-            # Fallback: pick the first meaningful line that isn't just the date.
-            for line in [ln.strip() for ln in card_text.splitlines() if ln.strip()]:
-                if re.fullmatch(r"\d{2}/\d{2}/\d{4}", line):
-                    continue
-                if "annonces trouv" in line.lower():
-                    continue
-                title = line
-                break
-
-        jobs.append(
-            Job(
-                source="tanitjobs",
-                external_id=jid,
-                title=title,
-                company="",
-                location="",
-                url=url,
-                posted_at=posted_at,
+        # Cards with usable anchor text skip all fallback string surgery.
+        # Otherwise (empty text or listing chrome like "2849 annonces
+        # trouvées"): browser-derived slug, then URL slug, then the first
+        # meaningful card line.
+        title = text
+        if not title or _NOISE_RE.search(title):
+            title = (
+                (item.get("slugTitle") or "").strip()
+                or _slug_from_url(url, jid)
+                or _first_meaningful_line(card_text)
+                or "(unknown)"
             )
+
+        job = Job(
+            source="tanitjobs",
+            external_id=jid,
+            title=title,
+            company="",
+            location="",
+            url=url,
+            posted_at=posted_at,
         )
+        jobs.append(job)
+        if relevance is not None and relevance(title):
+            relevant.append(job)
+
+    return jobs, relevant, dropped, len(unique)
+
+
+# Resolve the next-page URL fully in-browser: every selector strategy runs in
+# one evaluate instead of one CDP round trip each. Returns null when there is
+# no usable next link.
+_NEXT_PAGE_JS = r"""
+() => {
+  const cur = +(new URLSearchParams(location.search).get('page') || 1);
+  const next = cur + 1;
+  const el = document.querySelector(`a[href*='action=search'][href*='page=${next}']`)
+    || document.querySelector("a[rel='next']")
+    || document.querySelector('a.page-numbers.next')
+    || [...document.querySelectorAll('a')].find(a => /Suivant|Next/.test(a.textContent || ''));
+  const href = el && el.getAttribute('href');
+  return href ? new URL(href, location.href).href : null;
+}
+"""
+
+
+# Subresources that listing pages load but text extraction never needs
+# (logos, tracking pixels, CSS/font bundles). HTML and XHR stay live.
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
 
-    return jobs
+
+def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _wait_for_cards(page) -> None:
+    """Wait until job links are attached instead of sleeping a fixed delay.
+
+    Returns as soon as the listing is actually ready; a page with no job
+    links at all (e.g. an empty last page) just times out quietly and lets
+    the extraction report zero cards.
+    """
+    try:
+        page.wait_for_selector("a[href*='/job/']", state="attached")
+    except PWTimeoutError:
+        pass
 
 
 def _goto_next_page(page) -> bool:
@@ -150,66 +337,57 @@ def _goto_next_page(page) -> bool:
     On Tanitjobs /jobs, pagination is often rendered as links like:
       ?searchId=...&action=search&page=2
 
-    We resolve the current page number from the URL query (default 1) and then
-    follow the link to page+1 if present.
+    The in-browser lookup tries the page+1 anchor first and falls back to the
+    generic next-link selectors ('Suivant'/'Next', rel=next), then we issue a
+    single goto on the resolved absolute URL.
     """
 
-    cur_url = page.url or ""
-    m = re.search(r"[?&]page=(\d+)", cur_url)
-    cur_page = int(m.group(1)) if m else 1
-    next_page = cur_page + 1
-
-    # Try direct anchor for next page number.
-    sel = f"a[href*='action=search'][href*='page={next_page}']"
-    el = page.query_selector(sel)
-    if el:
-        href = el.get_attribute('href')
-        if href:
-            if href.startswith('?'):
-                href = 'https://www.tanitjobs.com/jobs' + href
-            elif href.startswith('/'):
-                href = 'https://www.tanitjobs.com' + href
-            page.goto(href, wait_until="domcontentloaded")
-        else:
-            el.click()
-            page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(800)
-        return True
+    try:
+        href = page.evaluate(_NEXT_PAGE_JS)
+    except Exception:
+        return False
+    if not href:
+        return False
 
-    # Fallback: sometimes there's a 'Suivant' link.
-    for s in ["a:has-text('Suivant')", "a:has-text('Next')", "a[rel='next']", "a.page-numbers.next"]:
-        try:
-            el = page.query_selector(s)
-            if el:
-                href = el.get_attribute('href')
-                if href:
-                    page.goto(href, wait_until='domcontentloaded')
-                else:
-                    el.click()
-                    page.wait_for_load_state('domcontentloaded')
-                page.wait_for_timeout(800)
-                return True
-        except Exception:
-            continue
+    page.goto(href, wait_until="domcontentloaded")
+    _wait_for_cards(page)
+    return True
 
-    return False
 
+# Live CDP sessions keyed by cdp_url: (playwright, browser, context, page).
+# Reconnecting costs seconds per invocation; a scheduled catchup against the
+# same browser reuses the warm session instead.
+_SESSIONS: Dict[str, tuple] = {}
 
-def run_catchup(cfg: CatchupConfig) -> Tuple[int, int, int, List[Job]]:
-    """Catch up by paging through listing pages.
 
-    Returns: (scraped, new, relevant_new, relevant_new_jobs)
+def _drop_session(cdp_url: str) -> None:
+    sess = _SESSIONS.pop(cdp_url, None)
+    if not sess:
+        return
+    try:
+        sess[0].stop()
+    except Exception:
+        pass
 
-    Note: Tanitjobs listing pages sometimes hide dates for promoted listings,
-    but normal listings contain a dd/mm/yyyy date which we parse.
+
+def get_or_create_page(cfg: CatchupConfig):
+    """Return a live page for cfg.cdp_url, reusing the cached session if healthy.
+
+    A cached page is probed with a trivial evaluate; on failure the whole
+    session is torn down and rebuilt.
     """
 
-    db = JobDB("data/jobs.sqlite3")
-    cutoff = _now_utc() - dt.timedelta(days=cfg.days)
-    total_scraped = 0
-    all_new: List[Job] = []
+    sess = _SESSIONS.get(cfg.cdp_url)
+    if sess:
+        page = sess[3]
+        try:
+            page.evaluate("1")
+            return page
+        except Exception:
+            _drop_session(cfg.cdp_url)
 
-    with sync_playwright() as p:
+    p = sync_playwright().start()
+    try:
         browser = p.chromium.connect_over_cdp(cfg.cdp_url)
         ctx = browser.contexts[0] if browser.contexts else browser.new_context()
 
@@ -222,50 +400,181 @@ def run_catchup(cfg: CatchupConfig) -> Tuple[int, int, int, List[Job]]:
         if page is None:
             page = ctx.new_page()
 
-        page.set_default_timeout(cfg.timeout_ms)
+        # Route only the page we drive, not the whole context — the CDP
+        # context is the user's live browser and their other tabs should
+        # keep rendering normally.
+        page.route("**/*", _block_heavy_resources)
+    except Exception:
+        try:
+            p.stop()
+        except Exception:
+            pass
+        raise
+
+    _SESSIONS[cfg.cdp_url] = (p, browser, ctx, page)
+    return page
+
+
+def run_catchup(cfg: CatchupConfig, page=None) -> Tuple[int, int, int, List[Job]]:
+    """Catch up by paging through listing pages.
+
+    Returns: (scraped, new, relevant_new, relevant_new_jobs)
+
+    The browser page persists between runs (module-level session cache, or a
+    caller-provided page), so only the first invocation pays the CDP
+    connect/handshake cost.
 
+    Note: Tanitjobs listing pages sometimes hide dates for promoted listings,
+    but normal listings contain a dd/mm/yyyy date which we parse.
+    """
+
+    db = JobDB("data/jobs.sqlite3")
+    cutoff = _now_utc() - dt.timedelta(days=cfg.days)
+    total_scraped = 0
+    all_jobs: List[Job] = []
+    relevant_jobs: List[Job] = []
+
+    # Known IDs loaded up front: dedup is a set lookup per card, the DB only
+    # ever sees the genuinely new delta, and there is a single upsert batch
+    # after the paging loop instead of a transaction per page.
+    known = {row[0] for row in db.conn.execute("SELECT external_id FROM jobs WHERE source = 'tanitjobs'")}
+    stale_pages = 0
+
+    if page is None:
+        page = get_or_create_page(cfg)
+
+    page.set_default_timeout(cfg.timeout_ms)
+
+    try:
+        page.goto(cfg.start_url, wait_until="domcontentloaded")
+        _wait_for_cards(page)
+        if "Just a moment" in (page.title() or ""):
+            return 0, 0, 0, []
+
+        for i in range(cfg.max_pages):
+            new_jobs, relevant, dropped, seen = _extract_jobs_from_page(page, cutoff, known, is_relevant)
+            total_scraped += seen
+            known.update(j.external_id for j in new_jobs)
+            all_jobs.extend(new_jobs)
+            relevant_jobs.extend(relevant)
+
+            # The browser already filtered out cards older than the
+            # cutoff; any dropped card means we've paged past the window.
+            if dropped:
+                break
+
+            # Two consecutive pages with nothing new means we've paged back
+            # into already-ingested territory (one stale page can just be a
+            # reshuffled promoted block).
+            stale_pages = 0 if new_jobs else stale_pages + 1
+            if i > 0 and stale_pages >= 2:
+                break
+
+            if not _goto_next_page(page):
+                break
+    except Exception:
+        # The browser or tab likely went away mid-run; drop the cached
+        # session so the next invocation reconnects fresh, but land the
+        # pages extracted so far first — a CDP drop on page 20 should not
+        # throw away 19 pages of results.
+        _drop_session(cfg.cdp_url)
+        db.upsert_jobs(all_jobs)
+        raise
+
+    all_new = db.upsert_jobs(all_jobs)
+    return total_scraped, len(all_new), len(relevant_jobs), relevant_jobs
+
+
+# How many listing pages to load at once in the parallel path. Keep small:
+# these are real tabs in the shared browser.
+_MAX_PARALLEL_PAGES = 3
+
+
+def _page_url(start_url: str, n: int) -> str:
+    if n <= 1:
+        return start_url
+    return f"{start_url}{'&' if '?' in start_url else '?'}page={n}"
+
+
+async def run_catchup_async(cfg: CatchupConfig) -> Tuple[int, int, int, List[Job]]:
+    """Parallel variant of run_catchup using a small async page pool.
+
+    The only cross-page dependency is the stop condition, so pages are
+    fetched speculatively in chunks of _MAX_PARALLEL_PAGES tabs, addressed
+    directly via the ?page=N template (no next-link discovery), and the
+    results are walked in page order to apply the same stop rules as the
+    sequential path. Tabs are created and closed per run; use run_catchup
+    when the warm persistent-page path matters more than parallelism.
+    """
+
+    db = JobDB("data/jobs.sqlite3")
+    cutoff = _now_utc() - dt.timedelta(days=cfg.days)
+    total_scraped = 0
+    all_jobs: List[Job] = []
+    relevant_jobs: List[Job] = []
+    known = {row[0] for row in db.conn.execute("SELECT external_id FROM jobs WHERE source = 'tanitjobs'")}
+    stale_pages = 0
+
+    async with async_playwright() as p:
+        browser = await p.chromium.connect_over_cdp(cfg.cdp_url)
+        ctx = browser.contexts[0] if browser.contexts else await browser.new_context()
+        pages = [await ctx.new_page() for _ in range(min(_MAX_PARALLEL_PAGES, cfg.max_pages))]
         try:
-            page.goto(cfg.start_url, wait_until="domcontentloaded")
-            page.wait_for_timeout(1200)
-            if "Just a moment" in (page.title() or ""):
-                return 0, 0, 0, []
-
-            for i in range(cfg.max_pages):
-                jobs = _extract_jobs_from_page(page)
-                total_scraped += len(jobs)
-
-                # If the last dated job on the page is older than our cutoff, we can stop.
-                dated = [j.posted_at for j in jobs if j.posted_at is not None]
-                if dated:
-                    oldest = min(dated)
-                    if oldest < cutoff:
-                        # Still upsert this page, but do not continue paging.
-                        pass
-
-                new_jobs = db.upsert_jobs(jobs)
-                if new_jobs:
-                    all_new.extend(new_jobs)
-
-                if dated and min(dated) < cutoff:
-                    break
-
-                # If we've reached pages that contain nothing new, stop.
-                if i > 0 and len(new_jobs) == 0:
-                    break
-
-                if not _goto_next_page(page):
-                    break
+            async def block(route):
+                if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            for pg in pages:
+                pg.set_default_timeout(cfg.timeout_ms)
+                await pg.route("**/*", block)
+
+            async def fetch(pg, n: int) -> dict:
+                await pg.goto(_page_url(cfg.start_url, n), wait_until="domcontentloaded")
+                try:
+                    await pg.wait_for_selector(_CARD_SELECTOR, state="attached")
+                except Exception:
+                    return {}
+                if n == 1 and "Just a moment" in (await pg.title() or ""):
+                    return {}
+                return await pg.eval_on_selector_all(_CARD_SELECTOR, _EXTRACT_JS, _cutoff_arg(cutoff))
+
+            stop = False
+            n = 1
+            while n <= cfg.max_pages and not stop:
+                chunk = range(n, min(n + len(pages), cfg.max_pages + 1))
+                results = await asyncio.gather(*(fetch(pg, num) for pg, num in zip(pages, chunk)))
+
+                for num, result in zip(chunk, results):
+                    new_jobs, relevant, dropped, seen = _jobs_from_eval(result or {}, known, is_relevant)
+                    total_scraped += seen
+                    known.update(j.external_id for j in new_jobs)
+                    all_jobs.extend(new_jobs)
+                    relevant_jobs.extend(relevant)
+
+                    # Same stop rules as the sequential walk, applied in page
+                    # order: past the date window, an empty page, or two
+                    # consecutive pages with nothing new.
+                    stale_pages = 0 if new_jobs else stale_pages + 1
+                    if dropped or not seen or (num > 1 and stale_pages >= 2):
+                        stop = True
+                        break
+                n = chunk[-1] + 1
+        except Exception:
+            # Same salvage as the sequential path: persist whatever the
+            # finished chunks produced before surfacing the failure.
+            db.upsert_jobs(all_jobs)
+            raise
         finally:
-            # If we reused an existing user tab, don't close it.
-            try:
-                # ctx.pages always includes open pages; heuristic: only close if it's a blank/new tab.
-                if (page.url or "").startswith("about:") or (page.url or "") == "":
-                    page.close()
-            except Exception:
-                pass
+            for pg in pages:
+                try:
+                    await pg.close()
+                except Exception:
+                    pass
 
-    relevant_new_jobs = [j for j in all_new if is_relevant(j.title)]
-    return total_scraped, len(all_new), len(relevant_new_jobs), relevant_new_jobs
+    all_new = db.upsert_jobs(all_jobs)
+    return total_scraped, len(all_new), len(relevant_jobs), relevant_jobs
 
 
 def main() -> int:
@@ -277,6 +586,7 @@ def main() -> int:
     ap.add_argument("--sheet-id", default="")
     ap.add_argument("--sheet-tab", default="Jobs")
     ap.add_argument("--sheet-account", default="wassimfekih2@gmail.com")
+    ap.add_argument("--parallel", action="store_true", help="Fetch pages speculatively in parallel tabs")
     args = ap.parse_args()
 
     cfg = CatchupConfig(
@@ -286,7 +596,10 @@ def main() -> int:
         start_url=args.start_url,
     )
 
-    scraped, new, relevant_new, relevant_new_jobs = run_catchup(cfg)
+    if args.parallel:
+        scraped, new, relevant_new, relevant_new_jobs = asyncio.run(run_catchup_async(cfg))
+    else:
+        scraped, new, relevant_new, relevant_new_jobs = run_catchup(cfg)
     print(f"tanitjobs catchup: pages<=%d scraped=%d new=%d relevant_new=%d" % (cfg.max_pages, scraped, new, relevant_new))
 
     for j in relevant_new_jobs[:20]: